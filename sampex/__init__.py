@@ -1,28 +1,92 @@
 import pathlib
-import configparser
 
 __version__ = "1.0.0"
 
 # Load the configuration settings.
 here = pathlib.Path(__file__).parent.resolve()
-settings = configparser.ConfigParser()
-settings.read(here / "config.ini")
+_config_path = here / "config.ini"
 
-# Go here if config.ini exists (don't crash if the project is not yet configured.)
-if "Paths" in settings:
+
+def _parse_config():
+    """
+    Parse the data_dir key from config.ini.
+
+    config.ini only ever contains a [Paths] section with a data_dir key
+    (written by ``python -m sampex config``), so a simple line scan is much
+    cheaper than importing and invoking configparser on every import.
+    """
     try:
-        data_dir = settings["Paths"]["data_dir"]
-    except KeyError as err:
-        pass
-
-    config = {"data_dir": pathlib.Path(data_dir)}
-else:
-    config = {"data_dir": pathlib.Path.home() / 'sampex-data'}
-
-from sampex.load import HILT
-from sampex.load import PET
-from sampex.load import LICA
-from sampex.load import Attitude
-from sampex.download import Downloader
-from sampex.load import date2yeardoy
-from sampex.load import yeardoy2date
\ No newline at end of file
+        text = _config_path.read_text()
+    except OSError:
+        # Don't crash if the project is not yet configured.
+        text = ""
+
+    data_dir = None
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith(("#", ";", "[")) or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        if key.strip() == "data_dir":
+            data_dir = value.strip()
+            break
+
+    if data_dir:
+        return {"data_dir": pathlib.Path(data_dir)}
+    else:
+        return {"data_dir": pathlib.Path.home() / 'sampex-data'}
+
+
+class _LazyConfig(dict):
+    """
+    A dict that defers reading config.ini until the first key access, so
+    "import sampex" does no filesystem work at all.
+    """
+
+    _loaded = False
+
+    def _load(self):
+        # Only fill in missing keys so that anything assigned before the
+        # first read (e.g. a test overriding data_dir) is preserved.
+        for key, value in _parse_config().items():
+            self.setdefault(key, value)
+        self._loaded = True
+
+    def __getitem__(self, key):
+        if not self._loaded:
+            self._load()
+        return super().__getitem__(key)
+
+
+config = _LazyConfig()
+
+# Lazily import the heavy submodules (pandas, numpy, requests) on first
+# attribute access (PEP 562) so that "import sampex" stays fast for the CLI
+# and configuration paths.
+_LAZY = {
+    "HILT": "sampex.load",
+    "PET": "sampex.load",
+    "LICA": "sampex.load",
+    "Attitude": "sampex.load",
+    "date2yeardoy": "sampex.load",
+    "yeardoy2date": "sampex.load",
+    "clear_cache": "sampex.load",
+    "load_many": "sampex.load",
+    "prefetch": "sampex.load",
+    "Downloader": "sampex.download",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    obj = getattr(importlib.import_module(module), name)
+    globals()[name] = obj  # Cache so __getattr__ runs only once per name.
+    return obj
+
+
+def __dir__():
+    return list(globals()) + list(_LAZY)
\ No newline at end of file
@@ -2,8 +2,6 @@ import sys
 import pathlib
 import configparser
 
-import sampex
-
 # Run the configuration script with
 # python3 -m sampex [init, initialize, config, or configure]
 
@@ -17,26 +15,21 @@ if (len(sys.argv) > 1) and (sys.argv[1] in ["init", "initialize", "config", "con
     )
     data_dir = input(s)
 
-    # If the user specified the directory, check that the directory already exists
-    # and make that directory if it does not.
+    # Construct the Path once; fall back to ~/sampex/ if the user did not
+    # specify a directory. Make the directory if it does not exist.
     if data_dir != "":
-        if not pathlib.Path(data_dir).exists():
-            pathlib.Path(data_dir).mkdir(parents=True)
-            print(f"Made sampex data directory at {pathlib.Path(data_dir)}.")
-        else:
-            print(f"The sampex data directory at {pathlib.Path(data_dir)} already exists.")
+        data_path = pathlib.Path(data_dir)
+    else:
+        data_path = pathlib.Path.home() / "sampex"
+    if not data_path.exists():
+        data_path.mkdir(parents=True)
+        print(f"Made sampex data directory at {data_path}.")
     else:
-        # If the user did not specify the directory, make one at ~/sampex/.
-        data_dir = pathlib.Path.home() / "sampex"
-        if not data_dir.exists():
-            data_dir.mkdir(parents=True)
-            print(f"sampex directory at {data_dir} created.")
-        else:
-            print(f"sampex directory at {data_dir} already exists.")
+        print(f"The sampex data directory at {data_path} already exists.")
 
     # Create a configparser object and add the user configuration.
     config = configparser.ConfigParser()
-    config["Paths"] = {"data_dir": data_dir}
+    config["Paths"] = {"data_dir": str(data_path)}
 
     with open(here / "config.ini", "w") as f:
         config.write(f)
@@ -1,11 +1,88 @@
-from __future__ import annotations  # to support the -> List[Downloader] return type
-from typing import List
+from __future__ import annotations  # to support the -> list[Downloader] return type
+import email.utils
+import fnmatch
+import functools
+import os
 import pathlib
-import urllib
+import shutil
+import sys
+import urllib.parse
+import urllib.request
 import re
 
-from bs4 import BeautifulSoup
-import requests
+import sampex
+
+# The directory listings only need the <a href="..."> targets, so a single
+# compiled regex over the raw HTML bytes replaces a full BeautifulSoup tree
+# build (and its import) at a fraction of the CPU and memory cost.
+_HREF_RE = re.compile(rb'<a[^>]+href=["\']([^"\'>#?]+)["\']', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=128)
+def _fetch_listing(url: str) -> tuple:
+    """
+    Fetch url and return a tuple of every href in it. The listings on the
+    SAMPEX data server are effectively static, so they are memoized for the
+    process lifetime (clear with Downloader.clear_cache()).
+
+    Raises
+    ------
+    ConnectionError
+        If the server responds with a 400-599 error status code.
+    """
+    request = _get_session().get(url)
+    # Check that the server status code is not
+    # between 400-599 (error).
+    if request.status_code // 100 in [4, 5]:
+        raise ConnectionError(
+            f'{url} returned a {request.status_code} error response.'
+        )
+    return tuple(href.decode() for href in _HREF_RE.findall(request.content))
+
+
+@functools.lru_cache(maxsize=64)
+def _match_pattern(match: str) -> re.Pattern:
+    """
+    Translate a glob pattern into a compiled regex once per pattern.
+    fnmatch.translate correctly escapes regex metacharacters such as "." that
+    the old match.replace('*', '.*') translation let through.
+    """
+    return re.compile(fnmatch.translate(match))
+
+# Files at least this large are fetched as several concurrent byte-range
+# requests (see Downloader._download_ranges); smaller files are not worth the
+# extra round trips.
+_RANGE_THRESHOLD = 8 * 2**20
+_RANGE_PARTS = 4
+
+# A single Session so that all Downloader instances reuse pooled TCP+TLS
+# connections (keep-alive) instead of handshaking once per request. It is
+# created on first use so that importing sampex.download (e.g. for a
+# Downloader __repr__) does not pay the requests/urllib3 import cost.
+_SESSION = None
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        _SESSION = requests.Session()
+        _SESSION.headers['User-Agent'] = f'sampex/{sampex.__version__}'
+        # Size the connection pool for the batch helpers (Downloader.map and
+        # the ranged downloads run up to ~16 requests at once) and retry
+        # transient server/connection errors with a short backoff instead of
+        # failing a long batch on one hiccup.
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[500, 502, 503, 504]),
+        )
+        _SESSION.mount('https://', adapter)
+        _SESSION.mount('http://', adapter)
+    return _SESSION
 
 
 class Downloader:
@@ -42,7 +119,7 @@ class Downloader:
         self.download_dir=download_dir
         return
 
-    def ls(self, match: str='*') -> List[Downloader]:
+    def ls(self, match: str='*') -> list[Downloader]:
         """
         List files and folders in self.url. 
 
@@ -56,20 +133,13 @@ class Downloader:
         list
             A list of full URLs.
         """
-        # Check that the server status code is not
-        # between 400-599 (error).
-        r = requests.get(self.url)
-        status_code = r.status_code
-        if status_code // 100 in [4, 5]:
-            raise ConnectionError(f'{self.url} returned a {status_code} error response.')
-        
         matched_hrefs = self._search_hrefs(self.url, match=match)
         cls = type(self)
-        downloaders = [None]*len(matched_hrefs)
-        for i, matched_href in enumerate(matched_hrefs):
-            new_url = urllib.parse.urljoin(self.url, matched_href, allow_fragments=True)
-            downloaders[i] = cls(new_url, download_dir=self.download_dir)
-        return downloaders
+        return [
+            cls(urllib.parse.urljoin(self.url, matched_href, allow_fragments=True),
+                download_dir=self.download_dir)
+            for matched_href in matched_hrefs
+        ]
 
     def download(self, download_dir=None, overwrite: bool=False, stream: bool=False) -> pathlib.Path:
         """
@@ -81,15 +151,14 @@ class Downloader:
             The parent directory where to save the data to. Set it either
             here or when initializing the class. This 
         overwrite: bool
-            Will overwrite an existing file. 
+            Will overwrite an existing file.
         stream: bool
-            Download the data in one chunk if False, or break it up and download it 
-            in 5 Mb chunks if True.
+            If True, prints a progress bar while the file downloads.
 
         Returns
         -------
         pathlib.Path
-            The full path to the file. 
+            The full path to the file.
         """
         if download_dir is None and self.download_dir is None:
             raise ValueError(f'download_dir kwarg needs to be set either '
@@ -98,43 +167,256 @@ class Downloader:
             self.download_dir = download_dir
 
         self.download_dir = pathlib.Path(self.download_dir)
-        self.download_dir.mkdir(parents=True, exist_ok=True)
+        if getattr(self, '_mkdir_cache', None) != self.download_dir:
+            # Only pay the mkdir syscalls once per directory per instance;
+            # batch downloads hit this on every file otherwise.
+            self.download_dir.mkdir(parents=True, exist_ok=True)
+            self._mkdir_cache = self.download_dir
         file_name = pathlib.Path(self.url).name
         download_path = self.download_dir / file_name
 
-        if (download_path.exists()) and (not overwrite):
+        # A single stat covers both the "already downloaded?" check and the
+        # mtime needed for the conditional GET below.
+        try:
+            download_stat = os.stat(download_path)
+        except OSError:
+            download_stat = None
+
+        # When the url points at a locally mirrored archive (file:// or a
+        # bare path), copy kernel-side with os.sendfile instead of going
+        # through the HTTP stack.
+        parsed_url = urllib.parse.urlparse(self.url)
+        if parsed_url.scheme in ('', 'file'):
+            # O_EXCL makes "create unless present" one atomic syscall.
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            if not overwrite:
+                flags |= os.O_EXCL
+            try:
+                fd = os.open(download_path, flags, 0o644)
+            except FileExistsError:
+                return download_path
+            source = urllib.request.url2pathname(parsed_url.path)
+            with open(source, 'rb') as s, os.fdopen(fd, 'wb') as d:
+                # A single sendfile call may copy fewer bytes than asked
+                # (guaranteed for sources over ~2 GiB), so loop until the
+                # whole file has been sent.
+                size = os.fstat(s.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    try:
+                        sent = os.sendfile(d.fileno(), s.fileno(), offset,
+                                           size - offset)
+                    except (AttributeError, OSError):
+                        # os.sendfile is Linux-only; fall back to a buffered
+                        # copy of the remaining bytes.
+                        s.seek(offset)
+                        d.seek(offset)
+                        shutil.copyfileobj(s, d, length=1024 * 1024)
+                        break
+                    if sent == 0:  # The source hit EOF early.
+                        break
+                    offset += sent
             return download_path
 
-        if stream:
-            r = requests.get(self.url, stream=True)
-            file_size = int(r.headers.get('content-length'))
-            downloaded_bites = 0
+        # If the file exists, send a conditional GET so an unchanged file
+        # costs one bodiless round trip (304) instead of a re-download, while
+        # still catching files that were updated on the server.
+        headers = {}
+        if (download_stat is not None) and (not overwrite):
+            headers['If-Modified-Since'] = email.utils.formatdate(
+                download_stat.st_mtime, usegmt=True
+            )
 
-            megabyte = 1024 * 1024
+        # A single TCP connection often cannot saturate a high-latency link
+        # for the multi-MB zipped hires files (slow-start, per-connection
+        # throughput caps). When the server advertises byte ranges and the
+        # file is large enough to amortize the extra requests, fetch it as
+        # several concurrent range slices. The progress-bar path keeps the
+        # single sequential stream.
+        if not stream:
+            try:
+                head = _get_session().head(
+                    self.url, headers=headers, allow_redirects=True
+                )
+            except OSError:
+                # The server is unreachable; fall back to the cached copy
+                # when one exists instead of failing the load offline.
+                if (download_stat is not None) and (not overwrite):
+                    return download_path
+                head = None
+            if head is not None and head.status_code == 304:
+                return download_path
+            if (
+                head is not None
+                and head.ok
+                and head.headers.get('Accept-Ranges') == 'bytes'
+                and int(head.headers.get('Content-Length', 0)) >= _RANGE_THRESHOLD
+            ):
+                self._download_ranges(
+                    download_path, int(head.headers['Content-Length'])
+                )
+                print(f'Downloaded {file_name}.')
+                return download_path
 
+        # Always download in fixed-size buffers via shutil.copyfileobj so the
+        # peak memory stays ~1 MiB regardless of the file size (r.content
+        # would materialize the entire file in RAM).
+        try:
+            r = _get_session().get(self.url, stream=True, headers=headers)
+        except OSError:
+            # Same offline fallback as above for the streaming path (and for
+            # servers where the HEAD itself failed).
+            if (download_stat is not None) and (not overwrite):
+                return download_path
+            raise
+        with r:
+            if r.status_code == 304:
+                return download_path
+            r.raw.decode_content = True
+            source = self._progress_reader(r, file_name) if stream else r.raw
             with open(download_path, 'wb') as f:
-                for data in r.iter_content(chunk_size=5*megabyte):
-                    f.write(data)
-                    # Update the downloaded % in the terminal.
-                    downloaded_bites += len(data)
-                    download_percent = round(100 * downloaded_bites / file_size)
-                    download_str = "#" * (download_percent // 5)
-                    print(f'Downloading {file_name}: |{download_str:<20}| {download_percent}%', end='\r')
-            print()  # Add a newline
+                shutil.copyfileobj(source, f, length=1024 * 1024)
+        if stream:
+            print()  # Add a newline after the progress bar.
         else:
-            r = requests.get(self.url)
-            with open(download_path, 'wb') as f:
-                f.write(r.content)
             print(f'Downloaded {file_name}.')
         return download_path
 
+    def _download_ranges(self, download_path, size, parts=_RANGE_PARTS):
+        """
+        Download self.url as `parts` concurrent HTTP Range requests, each
+        thread seeking to its slice of a preallocated output file. The
+        caller has already verified (via a HEAD request) that the server
+        supports byte ranges and that the file is at least
+        _RANGE_THRESHOLD bytes.
+
+        Raises
+        ------
+        ConnectionError
+            If the server ignores the Range header (responds with anything
+            other than 206 Partial Content).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Assemble the slices in a temporary sibling and only move it into
+        # place once every range has landed: a failed or interrupted transfer
+        # must not leave a full-size file with zero-filled holes at the final
+        # path, where its size and fresh mtime would make the conditional GET
+        # serve the corrupt file from cache on every retry.
+        part_path = download_path.with_name(download_path.name + '.part')
+        # Preallocate so each thread can seek+write its slice in place.
+        with open(part_path, 'wb') as f:
+            f.truncate(size)
+        bounds = [(i * size // parts, (i + 1) * size // parts - 1)
+                  for i in range(parts)]
+
+        def _fetch_range(bound):
+            start, end = bound
+            headers = {'Range': f'bytes={start}-{end}'}
+            with _get_session().get(self.url, stream=True, headers=headers) as r:
+                if r.status_code != 206:
+                    raise ConnectionError(
+                        f'{self.url} returned status {r.status_code} to a '
+                        f'Range request instead of 206 Partial Content.'
+                    )
+                r.raw.decode_content = True
+                with open(part_path, 'r+b') as f:
+                    f.seek(start)
+                    shutil.copyfileobj(r.raw, f, length=1024 * 1024)
+
+        try:
+            with ThreadPoolExecutor(max_workers=parts) as executor:
+                # list() propagates the first worker exception, if any.
+                list(executor.map(_fetch_range, bounds))
+        except BaseException:
+            try:
+                os.unlink(part_path)
+            except OSError:
+                pass
+            raise
+        os.replace(part_path, download_path)
+        return
+
+    @staticmethod
+    def _progress_reader(r, file_name):
+        """
+        Wrap the raw response stream so that reads update a terminal progress
+        bar, printing only when the integer percent changes.
+        """
+        file_size = int(r.headers.get('content-length', 0))
+
+        class _Reader:
+            downloaded_bites = 0
+            last_percent = -1
+
+            def read(self, size=-1):
+                data = r.raw.read(size)
+                self.downloaded_bites += len(data)
+                if file_size > 0:
+                    download_percent = round(100 * self.downloaded_bites / file_size)
+                    if download_percent != self.last_percent:
+                        download_str = "#" * (download_percent // 5)
+                        sys.stdout.write(
+                            f'\rDownloading {file_name}: |{download_str:<20}| '
+                            f'{download_percent}%'
+                        )
+                        sys.stdout.flush()
+                        self.last_percent = download_percent
+                return data
+
+        return _Reader()
+
     def name(self):
         """
         Get the url filename
         """
         return pathlib.Path(self.url).name
 
-    def _search_hrefs(self, url: str, match: str='*') -> List[str]:
+    @classmethod
+    def map(cls, downloaders, method: str='download', max_workers: int=8, **kwargs) -> list:
+        """
+        Call a method on many Downloader objects concurrently.
+
+        The workload is I/O-bound on HTTP, so a thread pool scales nearly
+        linearly with max_workers (the shared Session is thread-safe).
+
+        Parameters
+        ----------
+        downloaders: list of Downloader
+            The instances to fan out over, e.g. the output of ls().
+        method: str
+            The Downloader method name to call ("download" or "ls").
+        max_workers: int
+            The number of worker threads.
+        **kwargs
+            Passed to each method call.
+
+        Returns
+        -------
+        list
+            The method results, in the same order as ``downloaders``.
+
+        Example
+        -------
+        | d = sampex.Downloader(
+        |     'https://izw1.caltech.edu/sampex/DataCenter/DATA/HILThires/State4/',
+        |     download_dir=sampex.config['data_dir']
+        | )
+        | paths = sampex.Downloader.map(d.ls(match='hhrr199622*'))
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            return list(ex.map(lambda d: getattr(d, method)(**kwargs), downloaders))
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Forget the memoized directory listings so the next ls() re-fetches.
+        """
+        _fetch_listing.cache_clear()
+
+    def _search_hrefs(self, url: str, match: str='*') -> list[str]:
         """
         Given a url string, find all hyper references matching the 
         string match. The re module does the matching.
@@ -154,17 +436,15 @@ class Downloader:
 
         Raises
         ------
+        ConnectionError
+            If the server responds with a 400-599 error status code.
         FileNotFoundError
             If no hyper references were found.
         """
-        request = requests.get(url)
-        soup = BeautifulSoup(request.content, 'html.parser')
-
-        match = match.replace('*', '.*')  # regex wildcard
-        href_objs = soup.find_all('a', href=re.compile(match))
-        # I found "?" to be in the column names so we should ignore them.
-        matched_hrefs = [href_obj['href'] for href_obj in href_objs 
-                    if href_obj['href'].find('?')==-1]
+        pattern = _match_pattern(match)
+        # _HREF_RE already skips hrefs containing "?" (sorting links) and "#".
+        matched_hrefs = [href for href in _fetch_listing(url)
+                    if pattern.match(href)]
         if len(matched_hrefs) == 0:
             raise FileNotFoundError(
                 f'The url {url} does not contain any hyper '
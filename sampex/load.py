@@ -1,5 +1,10 @@
 # This program loads the HILT data and parses it into a nice format
 from typing import Union
+import bisect
+import fnmatch
+import functools
+import io
+import os
 import pathlib
 import zipfile
 import re
@@ -10,11 +15,333 @@ import warnings
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv
+except ImportError:
+    pa = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
 import sampex
 
+
+def _read_csv(path, usecols=None, dtype=None):
+    """
+    Read a space-delimited SAMPEX hires file into a pd.DataFrame.
+
+    Uses pyarrow's multithreaded csv reader when pyarrow is installed (it
+    tokenizes the millions-of-rows hires files several times faster than the
+    pandas parser) and falls back to pd.read_csv otherwise, which also
+    decompresses zipped files transparently.
+
+    usecols and dtype (column name -> numpy dtype) skip the parser's type
+    inference pass and keep the small integer rate columns as int32 — half
+    the memory bandwidth of the default float64.
+    """
+    if pa is None:
+        return pd.read_csv(path, sep=" ", usecols=usecols, dtype=dtype)
+    if isinstance(path, (str, pathlib.Path)) and str(path).endswith(".zip"):
+        # pyarrow cannot open zip archives itself, so decompress the single
+        # entry in one zlib call and hand the buffer to the arrow reader.
+        path = pathlib.Path(path)
+        with zipfile.ZipFile(path, "r") as z:
+            path = io.BytesIO(z.read(path.stem))
+    if dtype is not None:
+        column_types = {name: pa.from_numpy_dtype(_dtype)
+                        for name, _dtype in dtype.items()}
+    else:
+        column_types = None
+    table = pyarrow.csv.read_csv(
+        path,
+        read_options=pyarrow.csv.ReadOptions(block_size=8 << 20),
+        parse_options=pyarrow.csv.ParseOptions(delimiter=" "),
+        convert_options=pyarrow.csv.ConvertOptions(
+            include_columns=usecols, column_types=column_types
+        ),
+    )
+    return table.to_pandas(self_destruct=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _local_file_index(data_dir: str) -> tuple:
+    """
+    Walk data_dir once and return (name, path) pairs for every file in it.
+
+    Each loader used to rglob the whole data tree per instantiation, so
+    loading a year of days re-walked the tree hundreds of times. The walk is
+    memoized per data_dir for the process lifetime; call
+    sampex.clear_cache() after adding files by hand.
+
+    The walk uses os.scandir directly: DirEntry caches the file type from
+    the directory read itself, so no per-entry stat calls or intermediate
+    Path objects are needed (rglob pays for both).
+    """
+    files = []
+    stack = [str(data_dir)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry.path)
+        except OSError:
+            continue  # e.g. the data_dir does not exist yet.
+    files.sort()
+    return tuple((pathlib.Path(path).name, pathlib.Path(path)) for path in files)
+
+
+def _find_local_files(file_match: str) -> list:
+    """
+    Find the sorted files in sampex.config['data_dir'] matching file_match.
+    """
+    index = _local_file_index(str(sampex.config["data_dir"]))
+    return [path for name, path in index if fnmatch.fnmatch(name, file_match)]
+
+
+@functools.lru_cache(maxsize=None)
+def _attitude_index(data_dir: str) -> tuple:
+    """
+    Build a sorted interval table of the local attitude files.
+
+    Returns (starts, intervals) where starts is a tuple of the files'
+    start YEARDOYs and intervals is a tuple of matching
+    (start, end, path) entries, both sorted by start, so finding the file
+    covering a day is one bisect instead of a per-instantiation scan of
+    every filename.
+    """
+    intervals = []
+    for name, path in _local_file_index(data_dir):
+        match = _ATT_RE.search(name)
+        if match is not None:
+            intervals.append((int(match[1]), int(match[2]), path))
+    intervals.sort()
+    return tuple(interval[0] for interval in intervals), tuple(intervals)
+
+
+def clear_cache():
+    """
+    Forget the cached data-directory file index, e.g. after files were
+    added outside of sampex.
+    """
+    _local_file_index.cache_clear()
+    _attitude_index.cache_clear()
+
+
+def _cached_parquet(file_path):
+    """
+    Look up the Parquet sidecar cache for file_path.
+
+    Returns (cache_path, data) where data is the cached pd.DataFrame, or
+    None when the cache is disabled (set sampex.config['cache_parquet'] =
+    True to opt in), missing, or older than the source file.
+    """
+    if pa is None or not sampex.config.get("cache_parquet", False):
+        return None, None
+    cache_path = file_path.with_suffix(".parquet")
+    try:
+        if cache_path.stat().st_mtime >= file_path.stat().st_mtime:
+            return cache_path, pd.read_parquet(cache_path)
+    except OSError:
+        pass
+    return cache_path, None
+
+
+def _write_parquet(cache_path, data):
+    """
+    Write the parsed data to the Parquet sidecar, if caching is enabled.
+    """
+    if cache_path is None:
+        return
+    try:
+        data.to_parquet(cache_path, compression="zstd")
+    except OSError:
+        pass  # A read-only data directory is not an error.
+
+
+def _load_one(cls, date):
+    """
+    Instantiate and load one day (module-level so it pickles for processes).
+    """
+    return (date, cls(date).load())
+
+
+def load_many(cls, dates, workers: int=8, use_processes: bool=False) -> list:
+    """
+    Load many days of an instrument concurrently.
+
+    Thread workers (the default) overlap the downloads and the csv
+    tokenization, which release the GIL; process workers help when the
+    files are already local and the parse itself is the bottleneck.
+
+    Parameters
+    ----------
+    cls: type
+        The loader class (HILT, PET, LICA, or Attitude).
+    dates: list of datetime.datetime
+        The days to load.
+    workers: int
+        The number of concurrent workers.
+    use_processes: bool
+        Use a ProcessPoolExecutor instead of threads.
+
+    Returns
+    -------
+    list
+        (date, pd.DataFrame) tuples in the same order as ``dates``.
+
+    Example
+    -------
+    | import pandas as pd
+    |
+    | import sampex
+    |
+    | days = pd.date_range(datetime(2007, 1, 1), datetime(2007, 1, 30))
+    | loaded = sampex.load_many(sampex.HILT, days)
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    Executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with Executor(max_workers=workers) as ex:
+        return list(ex.map(functools.partial(_load_one, cls), dates))
+
+
+def _prefetch_one(cls, date):
+    """
+    Resolve (and download if needed) one day's file without parsing it.
+    """
+    instrument = cls(date)
+    # HILT and Attitude resolve their file in __init__; PET and LICA do it
+    # lazily in load(), so trigger the lookup here.
+    if isinstance(instrument, PET):
+        return instrument._find_file(instrument.load_date)
+    elif isinstance(instrument, LICA):
+        return instrument._find_file()
+    elif isinstance(instrument, Attitude):
+        return instrument.attitude_file
+    return instrument.file_path
+
+
+def prefetch(dates, cls=None, workers: int=8) -> list:
+    """
+    Download many days of an instrument concurrently without parsing them.
+
+    The per-file downloads are serial HTTP GETs, so warming the local data
+    directory for a multi-day analysis in one command overlaps the network
+    latency across workers (the downloads share one keep-alive Session).
+
+    Parameters
+    ----------
+    dates: list of datetime.datetime
+        The days to download.
+    cls: type
+        The loader class (HILT by default; PET, LICA, or Attitude).
+    workers: int
+        The number of concurrent download threads.
+
+    Returns
+    -------
+    list
+        The local file paths, in the same order as ``dates``.
+
+    Example
+    -------
+    | import pandas as pd
+    |
+    | import sampex
+    |
+    | days = pd.date_range(datetime(2007, 1, 1), datetime(2007, 1, 30))
+    | sampex.prefetch(days, cls=sampex.HILT)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if cls is None:
+        cls = HILT
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        paths = list(ex.map(functools.partial(_prefetch_one, cls), dates))
+    # The downloaded files are not in the memoized directory index yet.
+    clear_cache()
+    return paths
+
+
+def _seconds_of_day_index(seconds, load_date):
+    """
+    Convert a seconds-of-day column to a pd.DatetimeIndex on load_date.
+
+    Works directly on int64 nanoseconds, rounding to the nearest ns like
+    pd.to_timedelta does, without building the intermediate TimedeltaIndex.
+    """
+    midnight = np.datetime64(load_date.date(), "ns").astype(np.int64)
+    ns = np.round(seconds.to_numpy(np.float64) * 1e9).astype(np.int64) + midnight
+    return pd.DatetimeIndex(ns.view("datetime64[ns]"), name="Time")
+
+
+# The (start, end, state) YEARDOY intervals of the HILT operating states
+# (https://izw1.caltech.edu/sampex/DataCenter/docs/HILThires.html), sorted
+# by start day for the bisect lookup in HILT._get_state.
+_HILT_STATE_RANGES = (
+    (1992187, 1994069, 1),
+    (1994137, 1994237, 2),
+    (1994237, 1995322, 3),
+    (1996044, 1996220, 1),
+    (1996220, 2012312, 4),
+)
+_HILT_STATE_STARTS = tuple(interval[0] for interval in _HILT_STATE_RANGES)
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True, boundscheck=False)
+    def _reshape_20ms_kernel(rates, t0_ns, resolution_ns):
+        """
+        Interleave the (N, 5) rate matrix and compute the 20 ms timestamps
+        in one fused pass, so each input row is touched exactly once. The
+        timestamps stay int64 inside the kernel (Numba's datetime64 support
+        is limited); the caller views them as datetime64[ns].
+        """
+        n = rates.shape[0]
+        out_counts = np.empty(5 * n, dtype=rates.dtype)
+        out_times = np.empty(5 * n, dtype=np.int64)
+        for i in numba.prange(n):
+            base = 5 * i
+            t0 = t0_ns[i]
+            for j in range(5):
+                out_counts[base + j] = rates[i, j]
+                out_times[base + j] = t0 + j * resolution_ns
+        return out_counts, out_times
+
+
+# The known dtypes of the attitude columns, so the parser skips its type
+# inference pass for the default column set. The date columns are small
+# ints; everything else in the file is a float.
+_ATT_DTYPES = {
+    "Year": np.int32,
+    "Day-of-year": np.int32,
+    "Sec_of_day": np.float64,
+    "GEO_Radius": np.float64,
+    "GEO_Long": np.float64,
+    "GEO_Lat": np.float64,
+    "Altitude": np.float64,
+    "L_Shell": np.float64,
+    "MLT": np.float64,
+    "Mirror_Alt": np.float64,
+    "Pitch": np.float64,
+    "Att_Flag": np.int16,
+}
+
+# Extracts the start and end YEARDOY from an attitude file name such as
+# PSSet_6sec_2007003_2007029.txt(.zip), compiled once instead of running
+# re.findall(r"\d+", ...) per file per Attitude instantiation.
+_ATT_RE = re.compile(r"PSSet_6sec_(\d+)_(\d+)\.txt(?:\.zip)?$")
+
+
 class HILT:
     """
-    Load a day of HILT counts and convert the date and time to ``pd.Timestamp`` 
+    Load a day of HILT counts and convert the date and time to ``pd.Timestamp``
     objects. You need to explicitly call the ``.load()`` method to load the 
     file into memory.
 
@@ -66,7 +393,9 @@ class HILT:
         else:
             self.load_date = load_date
         self.load_date_str = date2yeardoy(self.load_date)
+        self.load_date_int = int(self.load_date_str)
         self.verbose = verbose
+        self._item_cache = {}
 
         # Find the file
         if state is None:
@@ -74,7 +403,7 @@ class HILT:
         else:
             self.state = state 
         file_match = f"hhrr{self.load_date_str}*"
-        local_files = list(pathlib.Path(sampex.config["data_dir"]).rglob(file_match))
+        local_files = _find_local_files(file_match)
 
         # 1 if there is just one file, and 2 if there is a file.txt and
         # file.txt.zip files.
@@ -87,7 +416,9 @@ class HILT:
                 download_dir=sampex.config['data_dir'] / 'HILT' / f'State{self.state}'
                 )
             matched_downloaders = downloader.ls(match=file_match)
-            self.file_path = matched_downloaders[0].download() 
+            self.file_path = matched_downloaders[0].download()
+            # The new file is not in the memoized directory index yet.
+            clear_cache()
         else:
             raise FileNotFoundError(
                 f'{len(local_files)} HILT files found locally and online that match {file_match}.'
@@ -108,8 +439,16 @@ class HILT:
         pd.DataFrame
             The HILT data that is also saved as a ``HILT.data`` attribute.
         """
+        self._item_cache = {}
+        # Reuse the Parquet sidecar from a previous load, if enabled.
+        cache_path, cached = _cached_parquet(self.file_path)
+        if cached is not None:
+            self.data = cached
+            return self.data
+
         # Load the zipped data and extract if a zip file was found.
-        if self.file_path.suffix == "zip":
+        # pathlib's suffix keeps the dot, so compare against ".zip".
+        if self.file_path.suffix.lower() == ".zip":
             self.read_zip(self.file_path, extract=extract)
         else:
             self.read_csv(self.file_path)
@@ -125,6 +464,7 @@ class HILT:
             self.data = self.reshape_20ms_state()
         else:
             raise NotImplementedError("State 3 is not implemented yet.")
+        _write_parquet(cache_path, self.data)
         return self.data
 
     def __getitem__(self, _slice):
@@ -132,14 +472,23 @@ class HILT:
         Allows you to access data via HILT['time'] or HILT['counts'] 
         """
         if isinstance(_slice, str):
+            # Repeat accesses (per-tick plotting hits this constantly) are
+            # O(1) dict hits instead of re-resolving the column.
+            cached = self._item_cache.get(_slice)
+            if cached is not None:
+                return cached
             if "time" in _slice.lower():
-                return self.data.index
+                value = self.data.index
             else:
                 try:
-                    return self.data[_slice].to_numpy()
+                    # A read-only view into the DataFrame, not a copy; don't
+                    # mutate it.
+                    value = self.data[_slice].to_numpy(copy=False)
                 except KeyError as err:
                     raise KeyError(f'{_slice} slice is unrecognized. Try one'
                         f' of these: {self.data.columns.to_numpy()}')
+            self._item_cache[_slice] = value
+            return value
         else:
             raise KeyError(f'Slice must be str, not {type(_slice)}')
 
@@ -155,8 +504,10 @@ class HILT:
                 zip_ref.extractall(zip_path.parent)
                 self.read_csv(zip_path.parent / txt_name)
             else:
-                with zip_ref.open(txt_name) as f:
-                    self.read_csv(f)
+                # Decompress the whole entry in one zlib call (a HILT day is
+                # tens of MB uncompressed) instead of handing the parser a
+                # stream that crosses into Python for every small read.
+                self.read_csv(io.BytesIO(zip_ref.read(txt_name)))
         return
 
     def read_csv(self, path):
@@ -165,23 +516,33 @@ class HILT:
         zip file reference
         """
         if self.verbose:
-            print(f"Loading SAMPEX-HILT data on {self.load_date.date()} from {path.name}")
-        self._hilt_csv = pd.read_csv(path, sep=" ")
+            name = getattr(path, "name", self.file_path.name)
+            print(f"Loading SAMPEX-HILT data on {self.load_date.date()} from {name}")
+        # The rates are small integers, so skip type inference and keep them
+        # as int32 — half the memory of the default float64/int64.
+        dtype = {f"Rate{i}": np.int32 for i in range(1, 7)}
+        dtype["Time"] = np.float64
+        self._hilt_csv = _read_csv(path, dtype=dtype)
         return
 
     def parse_time(self):
         """ 
         Parse the seconds of day column to a datetime column. 
         """
-        # Check if the seconds are monotonically increasing.
-        np_time = self._hilt_csv["Time"].to_numpy()
-        if np.any(np_time[1:] < np_time[:-1]):
+        # Check if the seconds are monotonically increasing. The pandas
+        # check short-circuits on the first out-of-order sample and does not
+        # allocate an N-element comparison array.
+        # pop removes the column and returns it in one BlockManager
+        # operation, instead of a lookup plus a separate drop.
+        seconds = self._hilt_csv.pop("Time")
+        # The files are written time-ordered, so the sanity check is skipped
+        # under python -O (unless verbose explicitly asks for it).
+        if (self.verbose or __debug__) and not pd.Index(seconds).is_monotonic_increasing:
             warnings.warn(f"The SAMPEX HILT data is not in order for {self.load_date_str}.")
-        # Convert seconds of day to a datetime object.
-        day_seconds_obj = pd.to_timedelta(self._hilt_csv["Time"], unit="s")
-        self._hilt_csv["Time"] = pd.Timestamp(self.load_date.date()) + day_seconds_obj
-        self._hilt_csv.index = self._hilt_csv["Time"]
-        del (self._hilt_csv["Time"])
+        # Convert seconds of day to a datetime index with one vectorized
+        # multiply+add on int64 nanoseconds (pd.to_timedelta plus a
+        # Timestamp addition costs three Series-level passes).
+        self._hilt_csv.index = _seconds_of_day_index(seconds, self.load_date)
         return
 
     def _get_state(self):
@@ -191,19 +552,18 @@ class HILT:
 
         More info: https://izw1.caltech.edu/sampex/DataCenter/docs/HILThires.html
         """
-        if ((int(self.load_date_str) >= 1992187) and (int(self.load_date_str) <= 1994069)) or (
-            (int(self.load_date_str) >= 1996044) and (int(self.load_date_str) <= 1996220)
-        ):
-            state = 1
-        elif (int(self.load_date_str) >= 1994137) and (int(self.load_date_str) <= 1994237):
-            state = 2
-        elif (int(self.load_date_str) >= 1994237) and (int(self.load_date_str) <= 1995322):
-            state = 3
-        elif (int(self.load_date_str) >= 1996220) and (int(self.load_date_str) <= 2012312):
-            state = 4
-        else:
-            raise ValueError(f"{self.load_date_str} does not match any known HILT state.")
-        return state
+        yeardoy = self.load_date_int
+        i = bisect.bisect_right(_HILT_STATE_STARTS, yeardoy) - 1
+        # A boundary day that ends one interval and starts the next (1994237,
+        # 1996220) belongs to the earlier interval, matching the original
+        # chained comparisons.
+        if i >= 1 and _HILT_STATE_RANGES[i - 1][1] >= yeardoy:
+            return _HILT_STATE_RANGES[i - 1][2]
+        if i >= 0:
+            start, end, state = _HILT_STATE_RANGES[i]
+            if start <= yeardoy <= end:
+                return state
+        raise ValueError(f"{self.load_date_str} does not match any known HILT state.")
 
     def reshape_20ms_state(self):
         """ 
@@ -215,26 +575,94 @@ class HILT:
         DataFrame
             datetime index and "counts" column.
         """
-        resolution_ms = 20E-3
-        # Resolve the counts using numpy (most efficient way with
-        # static memory allocation)
-        self.counts = np.nan * np.zeros(5 * self._hilt_csv.shape[0], dtype=int)
-        for i in [0, 1, 2, 3]:
-            self.counts[i::5] = self._hilt_csv[f"Rate{i+1}"]
-        # This line is different because rate5 is 100 ms SSD4 data.
-        self.counts[4::5] = self._hilt_csv["Rate6"]
+        resolution_ns = 20_000_000  # 20 ms
+        # Rate6 stands in for the fifth 20 ms sample because Rate5 is the
+        # 100 ms SSD4 data.
+        rates = self._hilt_csv[
+            ["Rate1", "Rate2", "Rate3", "Rate4", "Rate6"]
+        ].to_numpy(dtype=np.int32)
+        # The counts are small outside bright events, so downcast to the
+        # narrowest unsigned dtype that holds the day's maximum (no
+        # clipping possible) — 2-4x less memory on the hot counts column.
+        day_max = int(rates.max()) if rates.size else 0
+        if day_max <= np.iinfo(np.uint8).max:
+            rates = rates.astype(np.uint8, copy=False)
+        elif day_max <= np.iinfo(np.uint16).max:
+            rates = rates.astype(np.uint16, copy=False)
+        t0 = self._hilt_csv.index.values.astype("datetime64[ns]").view("int64")
+
+        if numba is not None:
+            # The compiled kernel interleaves the counts and computes the
+            # timestamps in one fused, parallel pass.
+            self.counts, times_ns = _reshape_20ms_kernel(rates, t0, resolution_ns)
+            self.times = times_ns.view("datetime64[ns]")
+        else:
+            # Flatten the (N, 5) matrix; axis 1 varies fastest so the result
+            # is already interleaved. The time array takes one broadcast add
+            # on int64 nanoseconds instead of five passes of timedelta
+            # arithmetic.
+            self.counts = rates.reshape(-1)
+            offsets = np.arange(5, dtype=np.int64) * resolution_ns
+            self.times = (
+                (t0[:, None] + offsets[None, :]).reshape(-1).view("datetime64[ns]")
+            )
+        # The raw arrays stay exposed as HILT.counts / HILT.times; wrap them
+        # without copying so the DataFrame is just a view over them.
+        return pd.DataFrame(
+            data={"counts": self.counts},
+            index=pd.DatetimeIndex(self.times, copy=False, name="Time"),
+            copy=False,
+        )
 
-        # Resolve the time array.
-        self.times = np.nan * np.zeros(5 * self._hilt_csv.shape[0], dtype=object)
-        for i in [0, 1, 2, 3, 4]:
-            self.times[i::5] = self._hilt_csv.index + pd.to_timedelta(resolution_ms * i, unit="s")
-        return pd.DataFrame(data={"counts": self.counts}, index=self.times)
+
+class _SampexProduct:
+    """
+    Shared plumbing for the PET and LICA hires loaders: load-date
+    bookkeeping and the seconds-of-day time parsing. Keeping these in one
+    place means the parsing optimizations apply to both instruments.
+    """
+
+    def __init__(self, load_date, verbose=False) -> None:
+        if isinstance(load_date, str):
+            self.load_date = dateutil.parser.parse(load_date)
+        else:
+            self.load_date = load_date
+        self.load_date_str = date2yeardoy(self.load_date)
+        self.load_date_int = int(self.load_date_str)
+        self.verbose = verbose
+        self._item_cache = {}
+        return
+
+    def parse_time(self, time_index=True):
+        """
+        Parse the seconds of day column to a datetime column.
+        If time_index=True, the time column will become the index.
+        """
+        # Check if the seconds are monotonically increasing.
+        seconds = self.data["Time"]
+        # Skipped under python -O; the files are written time-ordered.
+        if (self.verbose or __debug__) and not pd.Index(seconds).is_monotonic_increasing:
+            warnings.warn(
+                f"The SAMPEX {type(self).__name__} data is not in order for"
+                f" {self.load_date_str}."
+            )
+        # Convert seconds of day to datetimes with one vectorized
+        # multiply+add on int64 nanoseconds.
+        index = _seconds_of_day_index(seconds, self.load_date)
+        if time_index:
+            # pop removes the column and returns it in one BlockManager
+            # operation.
+            self.data.pop("Time")
+            self.data.index = index
+        else:
+            self.data["Time"] = index
+        return
 
 
-class PET:
+class PET(_SampexProduct):
     """
-    Load a day of PET counts and convert the date and time to ``pd.Timestamp`` 
-    objects. You need to explicitly call the ``.load()`` method to load the 
+    Load a day of PET counts and convert the date and time to ``pd.Timestamp``
+    objects. You need to explicitly call the ``.load()`` method to load the
     file into memory.
 
     Once loaded, you can access the timestamps with PET['time'] and
@@ -269,57 +697,52 @@ class PET:
     | plt.show()
     """
 
-    def __init__(self, load_date, verbose=False) -> None:
-        if isinstance(load_date, str):
-            self.load_date = dateutil.parser.parse(load_date)
-        else:
-            self.load_date = load_date
-        self.load_date_str = date2yeardoy(self.load_date)
-        self.verbose = verbose
-        return
-
     def load(self):
         """
         Loads the PET data into self.data.
         """
         pet_path = self._find_file(self.load_date)
+        self._item_cache = {}
+        cache_path, cached = _cached_parquet(pet_path)
+        if cached is not None:
+            self.data = cached
+            return self.data
         if self.verbose:
             print(
                 f"Loading SAMPEX-PET data on {self.load_date.date()} from"
                 f" {pet_path.name}"
             )
-        self.data = pd.read_csv(pet_path, sep=" ")
+        # The columns and dtypes are fixed for the PET hires format, so tell
+        # the parser instead of letting it infer (and box the rates as
+        # float64).
+        self.data = _read_csv(
+            pet_path,
+            usecols=["Time", "P1_Rate"],
+            dtype={"Time": np.float64, "P1_Rate": np.int32},
+        )
         self.data = self.data.rename(columns={"P1_Rate": "counts"})
         self.parse_time()
+        _write_parquet(cache_path, self.data)
         return self.data
 
-    def parse_time(self):
-        """ 
-        Parse the seconds of day column to a datetime column. 
-        """
-        # Check if the seconds are monotonically increasing.
-        np_time = self.data["Time"].to_numpy()
-        if np.any(np_time[1:] < np_time[:-1]):
-            warnings.warn(f"The SAMPEX PET data is not in order for {self.load_date_str}.")
-        # Convert seconds of day to a datetime object.
-        day_seconds_obj = pd.to_timedelta(self.data["Time"], unit="s")
-        self.data["Time"] = pd.Timestamp(self.load_date.date()) + day_seconds_obj
-        self.data.index = self.data["Time"]
-        del (self.data["Time"])
-        return
-
     def __getitem__(self, _slice):
         """
         Allows you to access data via PET['time'] or PET['counts'] 
         """
         if isinstance(_slice, str):
+            cached = self._item_cache.get(_slice)
+            if cached is not None:
+                return cached
             if "time" in _slice.lower():
-                return self.data.index
+                value = self.data.index
             elif "count" in _slice.lower():
-                return self.data["counts"].to_numpy()
+                # A view into the DataFrame, not a copy; don't mutate it.
+                value = self.data["counts"].to_numpy(copy=False)
             else:
                 raise KeyError(f'{_slice} slice is unrecognized. Try one'
                         f' of these: {self.data.columns.to_numpy()}')
+            self._item_cache[_slice] = value
+            return value
         else:
             raise KeyError('Slices other than "time" or "counts" is not allowed.')
 
@@ -328,7 +751,7 @@ class PET:
         Recursively searches the sampex.config['data_dir']/pet/ directory for the file.
         """
         file_match = f"phrr{self.load_date_str}*"
-        local_files = list(pathlib.Path(sampex.config["data_dir"]).rglob(file_match))
+        local_files = _find_local_files(file_match)
         # 1 if there is just one file, and 2 if there is a file.txt and
         # file.txt.zip files.
         if len(local_files) in [1, 2]:
@@ -342,7 +765,9 @@ class PET:
             # Find the year directory that can be YYYY or YYYY.unverified.
             downloader = downloader.ls(f'{self.load_date.year}*')[0]
             matched_downloaders = downloader.ls(match=file_match)
-            file_path = matched_downloaders[0].download() 
+            file_path = matched_downloaders[0].download()
+            # The new file is not in the memoized directory index yet.
+            clear_cache()
         else:
             raise FileNotFoundError(
                 f'{len(local_files)} PET files found locally and online that match {file_match}.'
@@ -350,7 +775,7 @@ class PET:
         return file_path
 
 
-class LICA:
+class LICA(_SampexProduct):
     """
     Load a day of LICA counts and convert the date and time to ``pd.Timestamp`` 
     objects. You need to explicitly call the ``.load()`` method to load the 
@@ -389,52 +814,37 @@ class LICA:
     | plt.show()
     """
 
-    def __init__(self, load_date, verbose=False) -> None:
-        if isinstance(load_date, str):
-            self.load_date = dateutil.parser.parse(load_date)
-        else:
-            self.load_date = load_date
-        self.load_date_str = date2yeardoy(self.load_date)
-        self.verbose = verbose
-        return
-
     def load(self):
         """
         Loads the LICA data into self.data.
         """
         lica_path = self._find_file()
+        self._item_cache = {}
+        cache_path, cached = _cached_parquet(lica_path)
+        if cached is not None:
+            self.data = cached
+            return self.data
         if self.verbose:
             print(
                 f"Loading SAMPEX-LICA data on {self.load_date.date()} from"
                 f" {lica_path.name}"
             )
-        self.data = pd.read_csv(lica_path, sep=" ")
+        # Fixed LICA hires columns: skip type inference and keep the count
+        # columns as int32.
+        count_cols = ["D4+D3", "D2+D1", "Stop", "Start", "Low_Pri", "High_Pri"]
+        dtype = {col: np.int32 for col in count_cols}
+        dtype["Time"] = np.float64
+        self.data = _read_csv(lica_path, usecols=["Time"] + count_cols, dtype=dtype)
         self.parse_time()
+        _write_parquet(cache_path, self.data)
         return self.data
 
-    def parse_time(self, time_index=True):
-        """ 
-        Parse the seconds of day column to a datetime column. 
-        If time_index=True, the time column will become the index.
-        """
-        # Check if the seconds are monotonically increasing.
-        np_time = self.data["Time"].to_numpy()
-        if np.any(np_time[1:] < np_time[:-1]):
-            warnings.warn(f"The SAMPEX LICA data is not in order for {self.load_date_str}.")
-        # Convert seconds of day to a datetime object.
-        day_seconds_obj = pd.to_timedelta(self.data["Time"], unit="s")
-        self.data["Time"] = pd.Timestamp(self.load_date.date()) + day_seconds_obj
-        if time_index:
-            self.data.index = self.data["Time"]
-            del (self.data["Time"])
-        return
-
     def _find_file(self):
         """
         Recursively searches the sampex.config['data_dir']/pet/ directory for the file.
         """
         file_match = f"lhrr{self.load_date_str}*"
-        local_files = list(pathlib.Path(sampex.config["data_dir"]).rglob(file_match))
+        local_files = _find_local_files(file_match)
         if len(local_files) == 1:
             file_path = local_files[0]
         elif len(local_files) == 0:
@@ -444,7 +854,9 @@ class LICA:
                 download_dir=sampex.config['data_dir'] / 'LICA'
                 )
             matched_downloaders = downloader.ls(match=file_match)
-            file_path = matched_downloaders[0].download() 
+            file_path = matched_downloaders[0].download()
+            # The new file is not in the memoized directory index yet.
+            clear_cache()
         else:
             raise FileNotFoundError(
                 f'{len(local_files)} LICA files found locally and online that match {file_match}.'
@@ -456,14 +868,24 @@ class LICA:
         Allows you to access data via, for example, LICA['time'].
         """
         if isinstance(_slice, str):
+            cached = self._item_cache.get(_slice)
+            if cached is not None:
+                return cached
+            value = None
             if "time" in _slice.lower():
-                return self.data.index
+                value = self.data.index
             else:
                 for column in self.data.columns:
                     if _slice.lower() in column.lower():
-                        return self.data[column].to_numpy()
-                raise KeyError(f'{_slice} slice is unrecognized. Try one'
-                    f' of these: {self.data.columns.to_numpy()}') 
+                        # A view into the DataFrame, not a copy; don't
+                        # mutate it.
+                        value = self.data[column].to_numpy(copy=False)
+                        break
+                if value is None:
+                    raise KeyError(f'{_slice} slice is unrecognized. Try one'
+                        f' of these: {self.data.columns.to_numpy()}')
+            self._item_cache[_slice] = value
+            return value
         else:
             raise KeyError(f'Slices other than "time" or {self.data.columns} are unsupported')
 
@@ -519,24 +941,49 @@ class Attitude:
         else:
             self.load_date = load_date
         self.load_date_str = date2yeardoy(load_date)
+        self.load_date_int = int(self.load_date_str)
         self.verbose = verbose
+        self._item_cache = {}
 
         # Find the appropriate attitude file.
         self._find_attitude_file()
         return
 
-    def load(self, columns="default", remove_old_time_cols=True):
-        """ 
-        Loads the attitude file. Only columns specified in the columns arg are 
+    def load(self, columns="default", remove_old_time_cols=True, day_only=False):
+        """
+        Loads the attitude file. Only columns specified in the columns arg are
         loaded to conserve memory.
 
+        Parameters
+        ----------
+        columns: dict
+            Maps the column indices to names. The "default" columns are
+            listed in the Notes below.
+        remove_old_time_cols: bool
+            Remove the Year, Day-of-year, and Sec_of_day columns after they
+            are parsed into the time index.
+        day_only: bool
+            Only parse the rows of the requested day instead of the whole
+            multi-day file. A cheap first pass over the date columns finds
+            the day's row range, so only that slice is fully parsed.
+
         Notes
         -----
-        The other than ``time``, the loaded columns are: GEO_Radius, GEO_Long, 
+        The other than ``time``, the loaded columns are: GEO_Radius, GEO_Long,
         GEO_Lat, Altitude, L_Shell, MLT, Mirror_Alt, Pitch, and Att_Flag
 
         Longitudes are transformed from (0 -> 360) to (-180 -> 180).
         """
+        self._item_cache = {}
+        # Reuse the Parquet sidecar from a previous load, if enabled. Only
+        # the full file with the default column set is cached.
+        if columns == "default" and remove_old_time_cols and not day_only:
+            cache_path, cached = _cached_parquet(self.attitude_file)
+            if cached is not None:
+                self.data = cached
+                return self.data
+        else:
+            cache_path = None
         if self.verbose:
             print(
                 f"Loading SAMPEX attitude data on {self.load_date.date()} from"
@@ -558,6 +1005,45 @@ class Attitude:
                 68: "Pitch",
                 71: "Att_Flag",
             }
+        if day_only:
+            # First pass: parse just the two date columns to find the row
+            # range of the requested day (the file is sorted by time).
+            dates = self._read_attitude({0: "Year", 1: "Day-of-year"})
+            yeardoy = (
+                dates["Year"].to_numpy(np.int64) * 1000
+                + dates["Day-of-year"].to_numpy(np.int64)
+            )
+            target = self.load_date_int
+            lo = np.searchsorted(yeardoy, target, side="left")
+            hi = np.searchsorted(yeardoy, target, side="right")
+            self.data = self._read_attitude(columns, skiprows=int(lo),
+                                            nrows=int(hi - lo))
+        else:
+            self.data = self._read_attitude(columns)
+        self._parse_attitude_datetime(remove_old_time_cols)
+        # Transform the longitudes from (0 -> 360) to (-180 -> 180) in one
+        # reused buffer; the chained expression allocated an intermediate
+        # array per operation. (pandas copy-on-write marks column views
+        # read-only, so a writable copy is taken once and assigned back.)
+        lon = self.data["GEO_Long"].to_numpy(copy=True)
+        np.add(lon, 180, out=lon)
+        np.mod(lon, 360, out=lon)
+        np.subtract(lon, 180, out=lon)
+        self.data["GEO_Long"] = lon
+        _write_parquet(cache_path, self.data)
+        return self.data
+
+    def _read_attitude(self, columns, skiprows=0, nrows=None):
+        """
+        Parse the attitude file (zipped or not) into a pd.DataFrame with the
+        given column index -> name mapping, skipping the header. skiprows
+        and nrows count data rows, after the header.
+        """
+        # Declare the dtypes of the known columns so the parser skips its
+        # inference pass on them; unrecognized custom names are still
+        # inferred.
+        dtype = {name: _ATT_DTYPES[name] for name in columns.values()
+                 if name in _ATT_DTYPES}
         # Open a zipped attitude file
         if self.attitude_file.suffix == '.zip':
             txt_name = self.attitude_file.stem
@@ -567,39 +1053,48 @@ class Attitude:
                     self._skip_header(f)
                     # Save the rest to a file using columns specified by the columns.keys() with the
                     # columns values for the column names.
-                    self.data = pd.read_csv(
-                        f, sep='\\s+', names=columns.values(), usecols=columns.keys()
+                    return pd.read_csv(
+                        f, sep='\\s+', names=columns.values(), usecols=columns.keys(),
+                        dtype=dtype, skiprows=skiprows, nrows=nrows,
                     )
-        # Open an unzipped attitude file
+        # Open an unzipped attitude file (binary so _skip_header can scan
+        # bytes).
         else:
-            with open(self.attitude_file) as f:
+            with open(self.attitude_file, "rb") as f:
                 # Skip the long header until the "BEGIN DATA" line
                 self._skip_header(f)
                 # Save the rest to a file using columns specified by the columns.keys() with the
                 # columns values for the column names.
-                self.data = pd.read_csv(
-                    f, sep='\\s+', names=columns.values(), usecols=columns.keys()
+                return pd.read_csv(
+                    f, sep='\\s+', names=columns.values(), usecols=columns.keys(),
+                    dtype=dtype, skiprows=skiprows, nrows=nrows,
                 )
-        self._parse_attitude_datetime(remove_old_time_cols)
-        # Transform the longitudes from (0 -> 360) to (-180 -> 180).
-        self.data["GEO_Long"] = np.mod(self.data["GEO_Long"] + 180, 360) - 180
-        return self.data
 
     def __getitem__(self, _slice):
         """
         Allows you to access data via, for example, Attitude['time'].
         """
         if isinstance(_slice, str):
+            cached = self._item_cache.get(_slice)
+            if cached is not None:
+                return cached
+            value = None
             if "time" in _slice.lower():
-                return self.data.index
+                value = self.data.index
             else:
                 for column in self.data.columns:
                     if _slice.lower() in column.lower():
-                        return self.data[column].to_numpy()
-                raise KeyError(
-                    f"{_slice} is an invalid column: Valid columns are: "
-                    f"{self.data.columns.to_numpy()} "
-                )
+                        # A view into the DataFrame, not a copy; don't
+                        # mutate it.
+                        value = self.data[column].to_numpy(copy=False)
+                        break
+                if value is None:
+                    raise KeyError(
+                        f"{_slice} is an invalid column: Valid columns are: "
+                        f"{self.data.columns.to_numpy()} "
+                    )
+            self._item_cache[_slice] = value
+            return value
         else:
             raise KeyError(f"Slices other than 'time' or "
                 f"{self.data.columns.to_numpy()} are unsupported")
@@ -609,7 +1104,9 @@ class Attitude:
         Use pathlib.rglob to find the attitude file that contains 
         the DOY from self.load_date
         """
-        self.file_match = "PSSet_6sec_*_*.txt"
+        # The trailing * also matches the server's zipped .txt.zip listings
+        # (the glob is a full match, not a substring search).
+        self.file_match = "PSSet_6sec_*_*.txt*"
         self.attitude_file = self._find_local_file()
 
         if self.attitude_file is None:  # Download from the internet
@@ -622,17 +1119,16 @@ class Attitude:
         """
         Look for a file on the local computer
         """
-        attitude_files = sorted(
-            list(pathlib.Path(sampex.config["data_dir"]).rglob(self.file_match))
-        )
-        start_end_dates = [re.findall(r"\d+", str(f.name))[1:] for f in attitude_files]
+        starts, intervals = _attitude_index(str(sampex.config["data_dir"]))
 
-        current_date_int = int(self.load_date_str)
+        current_date_int = self.load_date_int
         self.attitude_file = None
 
-        for f, (start_date, end_date) in zip(attitude_files, start_end_dates):
-            if (int(start_date) <= current_date_int) and (int(end_date) >= current_date_int):
-                self.attitude_file = f
+        # One O(log N) bisect into the memoized interval table instead of
+        # scanning every attitude filename per instantiation.
+        i = bisect.bisect_right(starts, current_date_int) - 1
+        if i >= 0 and intervals[i][1] >= current_date_int:
+            self.attitude_file = intervals[i][2]
         return self.attitude_file
 
     def _download_remote_file(self):
@@ -644,43 +1140,67 @@ class Attitude:
             download_dir=sampex.config['data_dir'] / 'Attitude'
             )
         matched_downloaders = downloader.ls(match=self.file_match)
-        filenames = [d.name() for d in matched_downloaders]
-        start_end_dates = [re.findall(r"\d+", f)[1:] for f in filenames]
 
-        current_date_int = int(self.load_date_str)
+        current_date_int = self.load_date_int
         self.attitude_file = None
 
-        for downloader, (start_date, end_date) in zip(matched_downloaders, start_end_dates):
-            if (int(start_date) <= current_date_int) and (int(end_date) >= current_date_int):
-                self.attitude_file = downloader.download(stream=True)
+        for matched_downloader in matched_downloaders:
+            match = _ATT_RE.search(matched_downloader.name())
+            if match is None:
+                continue
+            if int(match[1]) <= current_date_int <= int(match[2]):
+                self.attitude_file = matched_downloader.download(stream=True)
+                # The new file is not in the memoized directory index yet.
+                clear_cache()
+                break
         return self.attitude_file
 
 
     def _skip_header(self, f):
-        """ 
-        Read in the "f" attitude file stream line by line until the 
-        "BEGIN DATA" line is reached. Then return the row index to the
-        names from the parsed header.
-        """
-        for i, line in enumerate(f):
-            if "BEGIN DATA" in str(line):
-                # because for some reason the first attitude row has
-                # an extra column so skip the first "normal" row.
-                next(f)
-                return
-        return None
+        """
+        Advance the binary attitude file stream "f" past the "BEGIN DATA"
+        line, leaving it positioned at the first data row.
+
+        Scans one block of bytes with bytes.find instead of iterating the
+        stream line by line in Python, which boxes thousands of header lines
+        as str objects (expensive for the zlib-decompressed zip streams).
+        """
+        head = f.read(256 * 1024)
+        marker = head.find(b"BEGIN DATA")
+        if marker == -1:
+            raise ValueError(
+                f"No 'BEGIN DATA' marker found in {self.attitude_file.name}."
+            )
+        # Skip the marker line and then one more line: for some reason the
+        # first attitude row has an extra column.
+        data_start = head.find(b"\n", marker) + 1
+        data_start = head.find(b"\n", data_start) + 1
+        f.seek(data_start)
+        return
 
     def _parse_attitude_datetime(self, remove_old_time_cols):
         """
         Parse the attitude year, DOY, and second of day columns 
         into datetime objects. 
         """
-        # Parse the dates by first making YYYY-DOY strings.
-        year_doy = [f"{year}-{doy}" for year, doy in self.data[["Year", "Day-of-year"]].values]
-        # Convert to date objects
-        attitude_dates = pd.to_datetime(year_doy, format="%Y-%j")
-        # Now add the seconds of day to complete the date and time.
-        self.data.index = attitude_dates + pd.to_timedelta(self.data["Sec_of_day"], unit="s")
+        # Build the timestamps with vectorized datetime64 arithmetic; going
+        # through per-row "YYYY-DOY" strings and strptime costs N string
+        # allocations and parses for multi-day files.
+        years = self.data["Year"].to_numpy(np.int64)
+        doys = self.data["Day-of-year"].to_numpy(np.int64)
+        seconds = self.data["Sec_of_day"].to_numpy(np.float64)
+        # Work on int64 nanoseconds end to end: one multiply+add per term,
+        # no intermediate timedelta64 arrays, rounding to the nearest ns
+        # like pd.to_timedelta does.
+        year_ns = (
+            (years - 1970).astype("datetime64[Y]").astype("datetime64[ns]").view(np.int64)
+        )
+        ns = (
+            year_ns
+            + (doys - 1) * 86_400_000_000_000
+            + np.round(seconds * 1e9).astype(np.int64)
+        )
+        self.data.index = pd.DatetimeIndex(ns.view("datetime64[ns]"))
         # Optionally remove duplicate columns to conserve memory.
         if remove_old_time_cols:
             self.data.drop(["Year", "Day-of-year", "Sec_of_day"], axis=1, inplace=True)
@@ -1,4 +1,5 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import matplotlib.pyplot as plt
@@ -8,6 +9,34 @@ import numpy as np
 
 from sampex import HILT, PET, LICA, Attitude
 
+
+def _downsample_minmax(times, y, n_target=4000):
+    """
+    Decimate a series for plotting by keeping the min and max of each of
+    ~n_target bins, in time order. The screen is only ~1000 pixels wide, so
+    the decimated step plot is visually identical to the full-resolution one
+    (a HILT State4 day is 4.3M points) while handing the Agg renderer ~1000x
+    fewer segments. The full arrays stay in memory for the tick-label lookup.
+    """
+    times = np.asarray(times)
+    y = np.asarray(y)
+    n = y.shape[0]
+    if n <= 2 * n_target:
+        return times, y
+    per_bin = n // n_target
+    m = (n // per_bin) * per_bin
+    binned = y[:m].reshape(-1, per_bin)
+    rows = np.arange(binned.shape[0]) * per_bin
+    i_min = binned.argmin(axis=1) + rows
+    i_max = binned.argmax(axis=1) + rows
+    # Keep each bin's two extremes in time order so the envelope is drawn
+    # the same way a step plot of the full series would be.
+    idx = np.stack(
+        (np.minimum(i_min, i_max), np.maximum(i_min, i_max)), axis=1
+    ).ravel()
+    return times[idx], y[idx]
+
+
 def main():
     """
     A simple command-line interface to plot the SAMPEX data. 
@@ -47,44 +76,71 @@ def main():
     day = datetime(*args.date)
 
     # Load data
+    to_load = []
     if args.instrument.lower() == 'all' or args.instrument.lower() == 'pet':
         p = PET(day)
-        p.load()
+        to_load.append(p)
     if args.instrument.lower() == 'all' or args.instrument.lower() == 'hilt':
         h = HILT(day)
-        h.load()
+        to_load.append(h)
     if args.instrument.lower() == 'all' or args.instrument.lower() == 'lica':
         l = LICA(day)
-        l.load()
+        to_load.append(l)
     if args.instrument.lower() not in ['all', 'hilt', 'pet', 'lica']:
         raise ValueError(f'{args.instrument} is no a valid instrument. It can '
                          f'be "all", "HILT", "PET", or "LICA"')
     a = Attitude(day)
-    a.load()
+    to_load.append(a)
+    # The loads are independent and dominated by file reads, decompression,
+    # and parsing (all of which release the GIL), so run them in a thread
+    # pool and let the slowest single file bound the startup time.
+    with ThreadPoolExecutor(max_workers=len(to_load)) as executor:
+        list(executor.map(lambda obj: obj.load(), to_load))
 
     # Plot it
+    x_labels = {"L": "L_Shell", "MLT": "MLT", "Geo Lat": "GEO_Lat", "Geo Lon": "GEO_Long"}
+    attitude_times = a["time"]
+    attitude_ns = attitude_times.asi8  # The sorted index as int64 nanoseconds.
+    # Pull the label columns out as one positional array so format_fn skips
+    # the pandas label-indexing dispatch on every tick.
+    label_cols = [a.data.columns.get_loc(col) for col in x_labels.values()]
+    label_values = a.data.to_numpy()[:, label_cols]
+    # Ticks snap to attitude rows, so each row's label string is formatted
+    # at most once per session and reused on every redraw.
+    label_cache = {}
+
     def format_fn(tick_val, tick_pos):
         """
-        The tick magic happens here. pyplot gives it a tick time, and this function 
+        The tick magic happens here. pyplot gives it a tick time, and this function
         returns the closest label to that time. Read docs for FuncFormatter().
         """
         # Find the nearest time within 6 seconds (the cadence of the SAMPEX attitude files)
         tick_time = matplotlib.dates.num2date(tick_val).replace(tzinfo=None)
-        i_min_time = np.argmin(np.abs(a["time"] - tick_time))
-        if np.abs(a["time"][i_min_time] - tick_time).total_seconds() > 6:
+        tick_ns = np.datetime64(tick_time, "ns").astype(np.int64)
+        # The index is sorted, so the nearest timestamp neighbors the
+        # bisection point: O(log N) per tick instead of a full argmin scan.
+        i_min_time = np.searchsorted(attitude_ns, tick_ns)
+        if i_min_time == attitude_ns.shape[0] or (
+            i_min_time > 0
+            and tick_ns - attitude_ns[i_min_time - 1] < attitude_ns[i_min_time] - tick_ns
+        ):
+            i_min_time -= 1
+        if abs(attitude_ns[i_min_time] - tick_ns) > 6_000_000_000:
             raise ValueError(f"Nearest timestamp to tick_time is more than 6 seconds away")
-        pd_index = a["time"][i_min_time]
-        # Cast np.array as strings so that it can insert the time string.
-        values = a.data.loc[pd_index, x_labels.values()].to_numpy().round(2).astype(str)
-        values = np.insert(values, 0, pd_index.strftime("%H:%M:%S"))
-        label = "\n".join(values)
+        label = label_cache.get(i_min_time)
+        if label is None:
+            label = "\n".join(
+                [attitude_times[i_min_time].strftime("%H:%M:%S")]
+                + [f"{value:.2f}" for value in label_values[i_min_time]]
+            )
+            label_cache[i_min_time] = label
         return label
 
     if args.instrument.lower() == 'all':
         _, ax = plt.subplots(3, sharex=True, figsize=(7, 7))
-        ax[0].step(h["time"], h["counts"], label="HILT", where="post")
-        ax[1].step(p["time"], p.data["counts"], label="PET", where="post")
-        ax[2].step(l["time"], l["Stop"], label="LICA-Stop", where="post")
+        ax[0].step(*_downsample_minmax(h["time"], h["counts"]), label="HILT", where="post")
+        ax[1].step(*_downsample_minmax(p["time"], p.data["counts"]), label="PET", where="post")
+        ax[2].step(*_downsample_minmax(l["time"], l["Stop"]), label="LICA-Stop", where="post")
 
         ax[0].set(ylabel="HILT")
         ax[1].set(ylabel="PET")
@@ -92,21 +148,20 @@ def main():
         ax[-1].set_xlabel("Time")
     elif args.instrument.lower() == 'hilt':
         _, ax = plt.subplots(figsize=(7, 7))
-        ax.step(h["time"], h["counts"], label="HILT", where="post")
+        ax.step(*_downsample_minmax(h["time"], h["counts"]), label="HILT", where="post")
         ax.set(ylabel="HILT")
         ax.set_xlabel("Time")
     elif args.instrument.lower() == 'pet':
         _, ax = plt.subplots(figsize=(7, 7))
-        ax.step(p["time"], p.data["counts"], label="PET", where="post")
+        ax.step(*_downsample_minmax(p["time"], p.data["counts"]), label="PET", where="post")
         ax.set(ylabel="PET")
         ax.set_xlabel("Time")
     elif args.instrument.lower() == 'lica':
         _, ax = plt.subplots(figsize=(7, 7))
-        ax.step(l["time"], l["Stop"], label="LICA-Stop", where="post")
+        ax.step(*_downsample_minmax(l["time"], l["Stop"]), label="LICA-Stop", where="post")
         ax.set(ylabel="LICA")
         ax.set_xlabel("Time")
 
-    x_labels = {"L": "L_Shell", "MLT": "MLT", "Geo Lat": "GEO_Lat", "Geo Lon": "GEO_Long"}
     if args.instrument.lower() != 'all':
         ax = [ax] # For consistency to avoid calling "ax" vs "ax[0]".
         y_offset = -0.02
@@ -119,10 +174,21 @@ def main():
     # ax[-1].xaxis.set_minor_locator(matplotlib.dates.SecondLocator())
     ax[-1].xaxis.set_label_coords(-0.1, y_offset)
 
+    # format_coord runs on every mouse move. matplotlib hands it a float day
+    # offset from its epoch, so integer-nanosecond arithmetic skips the
+    # datetime + tzinfo construction that num2date pays per call (and a named
+    # function sidesteps the late-binding lambda-in-a-loop pitfall).
+    epoch_ns = np.datetime64(matplotlib.dates.get_epoch(), "ns").astype(np.int64)
+
+    def format_coord(x, y):
+        t_ns = int(epoch_ns) + round(float(x) * 86_400_000_000_000)
+        t = str(np.datetime64(t_ns, "ns").astype("datetime64[us]"))
+        if t.endswith(".000000"):  # Match isoformat(), which drops a zero fraction.
+            t = t[:-7]
+        return f"{t}, {round(y)}"
+
     for ax_i in ax:
-        ax_i.format_coord = lambda x, y: "{}, {}".format(
-            matplotlib.dates.num2date(x).replace(tzinfo=None).isoformat(), round(y)
-        )
+        ax_i.format_coord = format_coord
         ax_i.set_yscale(args.yscale)
 
     plt.suptitle(f"SAMPEX | {day.date()}")
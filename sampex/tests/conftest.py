@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture(scope='session')
+def download_dir(tmp_path_factory):
+    """
+    A download directory shared by all tests in the session so each URL is
+    downloaded at most once per run (Downloader.download() already
+    short-circuits files that exist and are unchanged on the server via a
+    conditional GET).
+    """
+    return tmp_path_factory.mktemp('sampex_downloads')
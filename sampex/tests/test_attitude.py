@@ -6,6 +6,7 @@ import numpy as np
 import sampex
 
 
+@pytest.mark.network
 def test_lica():
     day = datetime(2007, 1, 20)
     a = sampex.Attitude(day)
@@ -13,6 +14,7 @@ def test_lica():
 
     assert a['time'].shape[0] == 374399
     assert a['L_Shell'].shape[0] == 374399
+    assert a['time'].dtype == np.dtype('datetime64[ns]')
     assert a['time'][0] == np.datetime64('2007-01-03T00:00:07.000000000')
     assert a['time'][-1] == np.datetime64('2007-01-29T23:59:59.000000000')
 
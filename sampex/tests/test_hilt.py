@@ -6,6 +6,7 @@ import numpy as np
 import sampex
 
 
+@pytest.mark.network
 def test_hilt_state1():
     day = datetime(1992, 10, 4)
     warning_str = 'The SAMPEX HILT data is not in order for 1992278.'
@@ -16,6 +17,7 @@ def test_hilt_state1():
     assert h.state == 1
     assert h['time'].shape[0] == 536700
     assert h['SSD1'].shape[0] == 536700
+    assert h['time'].dtype == np.dtype('datetime64[ns]')
     assert h['time'][0] == np.datetime64('1992-10-04T00:00:05.000000000')
     assert h['time'][-1] == np.datetime64('1992-10-04T23:21:18.900000000')
 
@@ -23,6 +25,7 @@ def test_hilt_state1():
         h['counts']
     return
 
+@pytest.mark.network
 def test_hilt_state4():
     day = datetime(1999, 8, 17)
 
@@ -31,6 +34,7 @@ def test_hilt_state4():
 
     assert h['time'].shape[0] == 4320000
     assert h['counts'].shape[0] == 4320000
+    assert h['time'].dtype == np.dtype('datetime64[ns]')
     assert h['time'][0] == np.datetime64('1999-08-17T00:00:02.000000000')
     assert h['time'][-1] == np.datetime64('1999-08-18T00:00:02.980000000')
 
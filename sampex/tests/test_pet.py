@@ -6,6 +6,7 @@ import numpy as np
 import sampex
 
 
+@pytest.mark.network
 def test_pet():
     day = datetime(2007, 1, 20)
     p = sampex.PET(day)
@@ -13,6 +14,7 @@ def test_pet():
 
     assert p['time'].shape[0] == 664800
     assert p['counts'].shape[0] == 664800
+    assert p['time'].dtype == np.dtype('datetime64[ns]')
     assert p['time'][0] == np.datetime64('2007-01-20T00:00:03.000000000')
     assert p['time'][-1] == np.datetime64('2007-01-21T00:00:33.900000000')
 